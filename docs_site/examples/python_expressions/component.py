@@ -3,6 +3,21 @@ from django_components import Component, register, types
 DESCRIPTION = "Evaluate Python expressions directly in template using parentheses."
 
 
+# Button classes are made of a fixed base, plus one fragment for each of variant, size and disabled.
+# Unknown variants and sizes add no classes.
+_BUTTON_CLASSES = "px-4 py-2 rounded font-medium{variant}{size}{disabled}".format
+_BUTTON_VARIANT_CLASSES = {
+    "primary": " bg-blue-600 text-white hover:bg-blue-700",
+    "secondary": " bg-gray-200 text-gray-800 hover:bg-gray-300",
+    "danger": " bg-red-600 text-white hover:bg-red-700",
+}
+_BUTTON_SIZE_CLASSES = {
+    "small": " text-sm px-2 py-1",
+    "large": " text-lg px-6 py-3",
+}
+_BUTTON_DISABLED_CLASSES = " opacity-50 cursor-not-allowed"
+
+
 @register("button")
 class Button(Component):
     class Kwargs:
@@ -13,27 +28,16 @@ class Button(Component):
 
     def get_template_data(self, args, kwargs, slots, context):
         # Determine button classes based on variant and size
-        classes = ["px-4", "py-2", "rounded", "font-medium"]
-
-        if kwargs.variant == "primary":
-            classes.extend(["bg-blue-600", "text-white", "hover:bg-blue-700"])
-        elif kwargs.variant == "secondary":
-            classes.extend(["bg-gray-200", "text-gray-800", "hover:bg-gray-300"])
-        elif kwargs.variant == "danger":
-            classes.extend(["bg-red-600", "text-white", "hover:bg-red-700"])
-
-        if kwargs.size == "small":
-            classes.extend(["text-sm", "px-2", "py-1"])
-        elif kwargs.size == "large":
-            classes.extend(["text-lg", "px-6", "py-3"])
-
-        if kwargs.disabled:
-            classes.extend(["opacity-50", "cursor-not-allowed"])
+        classes = _BUTTON_CLASSES(
+            variant=_BUTTON_VARIANT_CLASSES.get(kwargs.variant, ""),
+            size=_BUTTON_SIZE_CLASSES.get(kwargs.size, ""),
+            disabled=_BUTTON_DISABLED_CLASSES if kwargs.disabled else "",
+        )
 
         return {
             "text": kwargs.text,
             "disabled": kwargs.disabled,
-            "classes": " ".join(classes),
+            "classes": classes,
         }
 
     template: types.django_html = """
@@ -85,15 +89,10 @@ class SearchInput(Component):
         min_length: int | None = None
 
     def get_template_data(self, args, kwargs, slots, context):
-        attrs = {}
-        if kwargs.required:
-            attrs["required"] = True
-        if kwargs.min_length:
-            attrs["minlength"] = kwargs.min_length
-
         return {
             "placeholder": kwargs.placeholder,
-            "attrs": attrs,
+            "required": kwargs.required,
+            "minlength": kwargs.min_length,
         }
 
     template: types.django_html = """
@@ -101,8 +100,7 @@ class SearchInput(Component):
             type="search"
             placeholder="{{ placeholder }}"
             class="px-4 py-2 border rounded"
-            {% for key, value in attrs.items %}
-                {{ key }}="{{ value }}"
-            {% endfor %}
+            {% if required %}required{% endif %}
+            {% if minlength %}minlength="{{ minlength }}"{% endif %}
         >
     """
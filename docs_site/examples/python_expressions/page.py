@@ -5,23 +5,20 @@ from django.http import HttpRequest, HttpResponse
 from django_components import Component, types
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     username: str
     status: str
     role: str
     points: int
-    is_admin: bool = False
+    is_admin_override: bool | None = None
 
-    def __post_init__(self):
-        # Derive is_admin from role if not explicitly set to True
-        if not self.is_admin:
-            self.is_admin = self.role == "admin"
-
-
-@dataclass
-class Item:
-    title: str
+    # Derived from role on access, unless explicitly set
+    @property
+    def is_admin(self) -> bool:
+        if self.is_admin_override is not None:
+            return self.is_admin_override
+        return self.role == "admin"
 
 
 class PythonExpressionsPage(Component):
@@ -31,7 +28,7 @@ class PythonExpressionsPage(Component):
         my_user: User
         bonus_points: int
         name: str
-        items: list[Item]
+        items: list[str]
         config: dict
 
     def get_template_data(self, args, kwargs: Kwargs, slots, context):
@@ -176,7 +173,7 @@ class PythonExpressionsPage(Component):
                             <pre
                                 class="text-sm bg-gray-800 text-gray-100 p-2 rounded overflow-x-auto"
                             ><code>{% verbatim %}{% component "button"
-    text=(items[0].title if items else 'No Items')
+    text=(items[0] if items else 'No Items')
     disabled=(items_len == 0)
     variant=(config.get('button_style', 'primary'))
 / %}{% endverbatim %}</code></pre>
@@ -186,7 +183,7 @@ class PythonExpressionsPage(Component):
                             </div>
                             <div class="space-x-2">
                                 {% component "button"
-                                    text=(items[0].title if items else 'No Items')
+                                    text=(items[0] if items else 'No Items')
                                     disabled=(items_len == 0)
                                     variant=(config.get('button_style', 'primary'))
                                 / %}
@@ -255,7 +252,7 @@ class PythonExpressionsPage(Component):
                 my_user=User(username="johndoe", status="active", role="admin", points=150),
                 bonus_points=25,
                 name="large",
-                items=[Item(title="First Item"), Item(title="Second Item")],
+                items=["First Item", "Second Item"],
                 config={"button_style": "secondary"},
             )
             return PythonExpressionsPage.render_to_response(request=request, kwargs=kwargs)
@@ -7,23 +7,20 @@ from django_components import registry, types
 from django_components.testing import djc_test
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     username: str
     status: str
     role: str
     points: int
-    is_admin: bool = False
+    is_admin_override: bool | None = None
 
-    def __post_init__(self):
-        # Derive is_admin from role if not explicitly set to True
-        if not self.is_admin:
-            self.is_admin = self.role == "admin"
-
-
-@dataclass
-class Item:
-    title: str
+    # Derived from role on access, unless explicitly set
+    @property
+    def is_admin(self) -> bool:
+        if self.is_admin_override is not None:
+            return self.is_admin_override
+        return self.role == "admin"
 
 
 def _import_components():
@@ -62,12 +59,12 @@ class TestPythonExpressions:
         template = Template(template_str)
 
         # When user is admin, variant should be 'danger'
-        user_admin = User(username="admin", status="active", role="admin", points=100, is_admin=True)
+        user_admin = User(username="admin", status="active", role="admin", points=100, is_admin_override=True)
         rendered = template.render(Context({"my_user": user_admin}))
         assert "bg-red-600" in rendered
 
         # When user is not admin, variant should be 'primary'
-        user_regular = User(username="user", status="active", role="user", points=50, is_admin=False)
+        user_regular = User(username="user", status="active", role="user", points=50, is_admin_override=False)
         rendered = template.render(Context({"my_user": user_regular}))
         assert "bg-blue-600" in rendered
 
@@ -119,14 +116,14 @@ class TestPythonExpressions:
         template_str: types.django_html = """
             {% load component_tags %}
             {% component "button"
-                text=(items[0].title if items else 'No Items')
+                text=(items[0] if items else 'No Items')
                 disabled=(items_len == 0)
             / %}
         """
         template = Template(template_str)
 
         # With items
-        items = [Item(title="First Item")]
+        items = ["First Item"]
         rendered = template.render(Context({"items": items, "items_len": len(items)}))
         assert "First Item" in rendered
         assert "disabled" not in rendered
@@ -157,3 +154,37 @@ class TestPythonExpressions:
         assert "bg-blue-600" in rendered
         assert "Save" in rendered
         assert "Submit" not in rendered
+
+    def test_button_classes(self):
+        _import_components()
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "button" text="Save" variant=variant size=size disabled=disabled / %}
+        """
+        template = Template(template_str)
+
+        rendered = template.render(Context({"variant": "danger", "size": "small", "disabled": True}))
+        assert (
+            'class="px-4 py-2 rounded font-medium bg-red-600 text-white hover:bg-red-700 '
+            'text-sm px-2 py-1 opacity-50 cursor-not-allowed"'
+        ) in rendered
+
+        # Unknown variant and size add no classes
+        rendered = template.render(Context({"variant": "ghost", "size": "MEDIUM", "disabled": False}))
+        assert 'class="px-4 py-2 rounded font-medium"' in rendered
+
+    def test_search_input_attributes(self):
+        _import_components()
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "search_input" required=(min_len > 0) min_length=(min_len or None) / %}
+        """
+        template = Template(template_str)
+
+        rendered = template.render(Context({"min_len": 3}))
+        assert "required" in rendered
+        assert 'minlength="3"' in rendered
+
+        rendered = template.render(Context({"min_len": 0}))
+        assert "required" not in rendered
+        assert "minlength" not in rendered
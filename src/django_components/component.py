@@ -1,8 +1,9 @@
 # ruff: noqa: ARG002, N805
 from collections.abc import Callable, Generator, Mapping
 from dataclasses import dataclass, is_dataclass
+from functools import partial
 from inspect import signature
-from types import MethodType
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -50,7 +51,6 @@ from django_components.template import cache_component_template_file
 from django_components.util.context import gen_context_processors_data
 from django_components.util.misc import (
     convert_class_to_namedtuple,
-    default,
     gen_component_id,
     hash_comp_cls,
     to_dict,
@@ -79,16 +79,34 @@ CompHashMapping: TypeAlias = WeakValueDictionary[str, type["Component"]]
 
 # Keep track of all the Component classes created, so we can clean up after tests
 ALL_COMPONENTS: AllComponents = []
+# Number of classes in `ALL_COMPONENTS` that were garbage collected since the last cleanup
+_dead_component_refs_count = 0
+_all_components_lock = Lock()
+
+
+def _on_component_class_collected() -> None:
+    # NOTE: We only count the dead references here, and remove them in `_add_component_ref()`.
+    #       The finalizer runs whenever GC kicks in, e.g. while `djc_test` iterates over `ALL_COMPONENTS`,
+    #       so it must not modify the list.
+    global _dead_component_refs_count  # noqa: PLW0603
+    _dead_component_refs_count += 1
+
+
+def _add_component_ref(comp_cls: type["Component"]) -> None:
+    global _dead_component_refs_count  # noqa: PLW0603
+    with _all_components_lock:
+        # Drop references to garbage-collected classes once they make up over half of the list,
+        # so `ALL_COMPONENTS` doesn't grow with every component class ever created.
+        if _dead_component_refs_count * 2 > len(ALL_COMPONENTS):
+            ALL_COMPONENTS[:] = [comp_ref for comp_ref in ALL_COMPONENTS if comp_ref() is not None]
+            _dead_component_refs_count = 0
+        ALL_COMPONENTS.append(cached_ref(comp_cls))  # type: ignore[arg-type]
+    finalize(comp_cls, _on_component_class_collected)
 
 
 def all_components() -> list[type["Component"]]:
     """Get a list of all created [`Component`][Component] classes."""
-    components: list[type[Component]] = []
-    for comp_ref in ALL_COMPONENTS:
-        comp = comp_ref()
-        if comp is not None:
-            components.append(comp)
-    return components
+    return [comp for comp_ref in ALL_COMPONENTS if (comp := comp_ref()) is not None]
 
 
 # NOTE: Initially, we fetched components by their registered name, but that didn't work
@@ -133,7 +151,7 @@ def get_component_by_class_id(comp_cls_id: str) -> type["Component"]:
 
 
 # TODO_v1 - Remove with `Component.input`
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ComponentInput:
     """
     Deprecated. Will be removed in v1.
@@ -368,7 +386,7 @@ class ComponentVars(NamedTuple):
 # Descriptor to pass getting/setting of `template_name` onto `template_file`
 class ComponentTemplateNameDescriptor:
     def __get__(self, instance: "Component | None", cls: type["Component"]) -> Any:
-        obj = default(instance, cls)
+        obj = cls if instance is None else instance
         return obj.template_file  # type: ignore[attr-defined]
 
     def __set__(self, instance_or_cls: "Component | type[Component]", value: Any) -> None:
@@ -3296,60 +3314,50 @@ class Component(metaclass=ComponentMeta):
         #           `MyComp.render(registered_name="my_comp", kwargs={"a": 1})`.
         # NOTE: We check for `id` as a proxy to decide if the component was instantiated by django-components
         #       or by the user. The `id` is set when a Component is instantiated from within `Component.render()`.
-        if id is None:
+        # NOTE: If none of `registered_name`, `outer_context`, `registry` were given, then the class methods
+        #       already behave the same, so we don't need to re-assign them.
+        if id is None and (registered_name is not None or outer_context is not None or registry is not None):
             # Update the `render()` and `render_to_response()` methods to so they use the `registered_name`,
             # `outer_context`, and `registry` as passed to the constructor.
             #
-            # To achieve that, we want to re-assign the class methods as instance methods that pass the instance
-            # attributes to the class methods.
-            # For that we have to "unwrap" the class methods via __func__.
-            # See https://stackoverflow.com/a/76706399/9788634
-            def primed_render(self: Component, *args: Any, **kwargs: Any) -> Any:
-                return self.__class__.render(
-                    *args,
-                    **{
-                        "registered_name": registered_name,
-                        "outer_context": outer_context,
-                        "registry": registry,
-                        **kwargs,
-                    },
-                )
-
-            def primed_render_to_response(self: Component, *args: Any, **kwargs: Any) -> Any:
-                return self.__class__.render_to_response(
-                    *args,
-                    **{
-                        "registered_name": registered_name,
-                        "outer_context": outer_context,
-                        "registry": registry,
-                        **kwargs,
-                    },
-                )
-
-            self.render_to_response = MethodType(primed_render_to_response, self)  # type: ignore[method-assign]
-            self.render = MethodType(primed_render, self)  # type: ignore[method-assign]
+            # To achieve that, we shadow the class methods with instance attributes that pass these
+            # to the class methods. Keyword arguments given to the call still take precedence.
+            self.render_to_response = partial(  # type: ignore[method-assign]
+                self.__class__.render_to_response,
+                registered_name=registered_name,
+                outer_context=outer_context,
+                registry=registry,
+            )
+            self.render = partial(  # type: ignore[method-assign]
+                self.__class__.render,
+                registered_name=registered_name,
+                outer_context=outer_context,
+                registry=registry,
+            )
 
-        deps_strategy = cast("DependenciesStrategy", default(deps_strategy, "document"))
+        # NOTE: `__init__` runs on every render, so we check for `None` inline instead of using `default()`
+        if deps_strategy is None:
+            deps_strategy = "document"
 
-        self.id = default(id, gen_component_id, factory=True)  # type: ignore[arg-type]
+        self.id = gen_component_id() if id is None else id
         self.name = self._get_component_name(registered_name)
         self.registered_name: str | None = registered_name
-        self.args = default(args, [])
-        self.kwargs = default(kwargs, {})
-        self.slots = default(slots, {})
+        self.args = [] if args is None else args
+        self.kwargs = {} if kwargs is None else kwargs
+        self.slots = {} if slots is None else slots
         self.raw_args: list[Any] = self.args if isinstance(self.args, list) else list(self.args)
         self.raw_kwargs: dict[str, Any] = self.kwargs if isinstance(self.kwargs, dict) else to_dict(self.kwargs)
         self.raw_slots: dict[str, Slot] = self.slots if isinstance(self.slots, dict) else to_dict(self.slots)
-        self.context = default(context, Context())
+        self.context = Context() if context is None else context
         # TODO_v1 - Remove `is_filled`, superseded by `Component.slots`
-        self.is_filled = SlotIsFilled(to_dict(self.slots))
+        self.is_filled = SlotIsFilled(self.raw_slots)
         # TODO_v1 - Remove `Component.input`
         self.input = ComponentInput(
             context=self.context,
-            # NOTE: Convert args / kwargs / slots to plain lists / dicts
-            args=cast("list", args if isinstance(self.args, list) else list(self.args)),
-            kwargs=cast("dict", kwargs if isinstance(self.kwargs, dict) else to_dict(self.kwargs)),
-            slots=cast("dict", slots if isinstance(self.slots, dict) else to_dict(self.slots)),
+            # NOTE: Reuse args / kwargs / slots already converted to plain lists / dicts
+            args=self.raw_args,
+            kwargs=self.raw_kwargs,
+            slots=self.raw_slots,
             deps_strategy=deps_strategy,
             # TODO_v1 - Remove, superseded by `deps_strategy`
             type=deps_strategy,
@@ -3359,7 +3367,7 @@ class Component(metaclass=ComponentMeta):
         self.deps_strategy = deps_strategy
         self.request = request
         self.outer_context: Context | None = outer_context
-        self.registry = default(registry, registry_)
+        self.registry = registry_ if registry is None else registry
         self.node = node
         self.parent = parent
         self.root = root or self
@@ -3373,14 +3381,14 @@ class Component(metaclass=ComponentMeta):
         cls.class_id = hash_comp_cls(cls)
         comp_cls_id_mapping[cls.class_id] = cls
 
-        ALL_COMPONENTS.append(cached_ref(cls))  # type: ignore[arg-type]
+        _add_component_ref(cls)
         extensions._init_component_class(cls)
         extensions.on_component_class_created(OnComponentClassCreatedContext(cls))
 
     @classmethod
     def _get_component_name(cls, registered_name: str | None = None) -> str:
         """Internal: resolve display name for this component (registered name or class name)."""
-        return default(registered_name, cls.__name__)
+        return registered_name if registered_name is not None else cls.__name__
 
     def _call_data_methods(
         self,
@@ -3388,12 +3396,25 @@ class Component(metaclass=ComponentMeta):
         raw_args: list,
         raw_kwargs: dict,
     ) -> tuple[dict, dict, dict]:
+        # The default implementations of the data methods return nothing, so we skip them
+        # if the class doesn't override them.
+        # NOTE: This is checked on each render, not when the class is created, so that
+        #       methods assigned or patched onto the class later are still called.
+        comp_cls = type(self)
+
         # Template data
-        maybe_template_data = self.get_template_data(self.args, self.kwargs, self.slots, self.context)
-        new_template_data = to_dict(default(maybe_template_data, {}))
+        if comp_cls.get_template_data is not Component.get_template_data:
+            maybe_template_data = self.get_template_data(self.args, self.kwargs, self.slots, self.context)
+            new_template_data = {} if maybe_template_data is None else to_dict(maybe_template_data)
+        else:
+            new_template_data = {}
 
         # TODO_V2 - Remove this in v2
-        legacy_template_data = to_dict(default(self.get_context_data(*raw_args, **raw_kwargs), {}))
+        if comp_cls.get_context_data is not Component.get_context_data:
+            maybe_legacy_template_data = self.get_context_data(*raw_args, **raw_kwargs)
+            legacy_template_data = {} if maybe_legacy_template_data is None else to_dict(maybe_legacy_template_data)
+        else:
+            legacy_template_data = {}
         if legacy_template_data and new_template_data:
             raise RuntimeError(
                 f"Component {self.name} has both `get_context_data()` and `get_template_data()` methods. "
@@ -3402,12 +3423,18 @@ class Component(metaclass=ComponentMeta):
         template_data = new_template_data or legacy_template_data
 
         # JS data
-        maybe_js_data = self.get_js_data(self.args, self.kwargs, self.slots, self.context)
-        js_data = to_dict(default(maybe_js_data, {}))
+        if comp_cls.get_js_data is not Component.get_js_data:
+            maybe_js_data = self.get_js_data(self.args, self.kwargs, self.slots, self.context)
+            js_data = {} if maybe_js_data is None else to_dict(maybe_js_data)
+        else:
+            js_data = {}
 
         # CSS data
-        maybe_css_data = self.get_css_data(self.args, self.kwargs, self.slots, self.context)
-        css_data = to_dict(default(maybe_css_data, {}))
+        if comp_cls.get_css_data is not Component.get_css_data:
+            maybe_css_data = self.get_css_data(self.args, self.kwargs, self.slots, self.context)
+            css_data = {} if maybe_css_data is None else to_dict(maybe_css_data)
+        else:
+            css_data = {}
 
         # Validate outputs
         if self.TemplateData is not None and not isinstance(template_data, self.TemplateData):
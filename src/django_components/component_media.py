@@ -444,12 +444,27 @@ def _setup_lazy_media_resolve(comp_cls: type["Component"], attrs: dict[str, Any]
         setattr(comp_cls, attr, InterceptDescriptor(attr))
 
 
+# Map of media attributes to their (inlined, file) pair, e.g. `js` -> (`js`, `js_file`)
+_MEDIA_ATTR_PAIRS: dict[str, tuple[str, str]] = {
+    "js": ("js", "js_file"),
+    "js_file": ("js", "js_file"),
+    "css": ("css", "css_file"),
+    "css_file": ("css", "css_file"),
+    "template": ("template", "template_file"),
+    "template_file": ("template", "template_file"),
+}
+
+
 # Because the media values are not defined directly on the instance, but held in `_component_media`,
 # then simply accessing `_component_media.js` will NOT get the values from parent classes.
 #
 # So this function is like `getattr`, but for searching for values inside `_component_media`.
 def _get_comp_cls_attr(comp_cls: type["Component"], attr: str) -> Any:
-    for base in comp_cls.mro():
+    # NOTE: `Component.js` and `Component.css` are read on every render (to check that the component's
+    # JS / CSS is in the cache). So we use the pre-computed `__mro__` tuple instead of calling `mro()`,
+    # which re-computes the MRO each time.
+    pair_attrs = _MEDIA_ATTR_PAIRS.get(attr)
+    for base in comp_cls.__mro__:
         comp_media: ComponentMedia | None = getattr(base, "_component_media", None)
         if comp_media is None:
             continue
@@ -472,18 +487,11 @@ def _get_comp_cls_attr(comp_cls: type["Component"], attr: str) -> Any:
         # For each of the pairs of inlined_content + file (e.g. `js` + `js_file`), if at least one of the two
         # is defined, we interpret it such that this (sub)class has overridden what was set by the parent class(es),
         # and we won't search further up the MRO.
-        def is_pair_empty(inline_attr: str, file_attr: str) -> bool:
-            inline_attr_empty = getattr(comp_media, inline_attr, UNSET) is UNSET  # noqa: B023
-            file_attr_empty = getattr(comp_media, file_attr, UNSET) is UNSET  # noqa: B023
-
-            return inline_attr_empty and file_attr_empty
-
-        if attr in ("js", "js_file"):
-            is_empty_pair = is_pair_empty("js", "js_file")
-        elif attr in ("css", "css_file"):
-            is_empty_pair = is_pair_empty("css", "css_file")
-        elif attr in ("template", "template_file"):
-            is_empty_pair = is_pair_empty("template", "template_file")
+        if pair_attrs is not None:
+            inline_attr, file_attr = pair_attrs
+            is_empty_pair = (
+                getattr(comp_media, inline_attr, UNSET) is UNSET and getattr(comp_media, file_attr, UNSET) is UNSET
+            )
         else:
             is_empty_pair = False
 
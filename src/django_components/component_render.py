@@ -33,10 +33,10 @@ from django_components.extension import (
 )
 from django_components.perfutil.provide import register_provide_reference
 from django_components.template import prepare_component_template
-from django_components.util.context import snapshot_context
+from django_components.util.context import CopiedDict, snapshot_context
 from django_components.util.exception import set_component_error_message, with_component_error_message
-from django_components.util.logger import trace_component_msg
-from django_components.util.misc import default, gen_component_id, is_generator, to_dict
+from django_components.util.logger import is_trace_enabled, trace_component_msg
+from django_components.util.misc import gen_component_id, is_generator, to_dict
 
 if TYPE_CHECKING:
     from django_components.component import (
@@ -146,7 +146,7 @@ class ComponentTreeContext:
 
 
 # Internal data that are made available within the component's template
-@dataclass
+@dataclass(slots=True)
 class ComponentContext:
     component: ComponentRef
     component_path: list[str]
@@ -236,8 +236,9 @@ def render_with_error_trace(
     """
     component_name = comp_cls._get_component_name(registered_name)
 
-    # Modify the error to display full component path (incl. slots)
-    with with_component_error_message([component_name]):
+    # NOTE: Same as `with with_component_error_message([component_name])`, but inlined,
+    #       because this runs for every rendered component.
+    try:
         render_id = gen_component_id()
         with _render_stack(deps_strategy) as deps_strategy_with_default:
             try:
@@ -260,6 +261,10 @@ def render_with_error_trace(
                 # Clean up if rendering fails
                 component_instance_cache.pop(render_id, None)
                 raise e from None
+    except Exception as err:
+        # Modify the error to display full component path (incl. slots)
+        set_component_error_message(err, [component_name])
+        raise err from None
 
 
 def _render_impl(
@@ -282,7 +287,7 @@ def _render_impl(
     make context copy, and defer actual template render via a generator.
     """
     # Import here to avoid circular import (component_render <-> component)
-    from django_components.component import ComponentVars  # noqa: PLC0415
+    from django_components.component import Component, ComponentVars  # noqa: PLC0415
     from django_components.slots import normalize_slot_fills  # noqa: PLC0415
 
     ######################################
@@ -292,25 +297,27 @@ def _render_impl(
     # Allow to pass down Request object via context.
     # `context` may be passed explicitly via `Component.render()` and `Component.render_to_response()`,
     # or implicitly via `{% component %}` tag.
+    #
+    # NOTE: We look up the parent component once here, and reuse it below when building the component tree.
+    #       Converting `context` from dict to `Context` further below doesn't change what's found.
+    parent_id, parent_comp_ctx = _get_parent_component_context(context) if context else (None, None)
     if request is None and context:
         # If the context is `RequestContext`, it has `request` attribute
         request = getattr(context, "request", None)
         # Check if this is a nested component and whether parent has request
-        if request is None:
-            _, parent_comp_ctx = _get_parent_component_context(context)
-            if parent_comp_ctx:
-                parent_comp = parent_comp_ctx.component()
-                request = parent_comp and parent_comp.request
+        if request is None and parent_comp_ctx:
+            parent_comp = parent_comp_ctx.component()
+            request = parent_comp and parent_comp.request
 
     component_name = comp_cls._get_component_name(registered_name)
 
     # Allow to provide no args/kwargs/slots/context
     # NOTE: We make copies of args / kwargs / slots, so that plugins can modify them
     # without affecting the original values.
-    args_list: list[Any] = list(default(args, []))
-    kwargs_dict = to_dict(default(kwargs, {}))
+    args_list: list[Any] = [] if args is None else list(args)
+    kwargs_dict = {} if kwargs is None else to_dict(kwargs)
     slots_dict = normalize_slot_fills(
-        to_dict(default(slots, {})),
+        {} if slots is None else to_dict(slots),
         component_name=component_name,
     )
     # Use RequestContext if request is provided, so that child non-component template tags
@@ -326,7 +333,6 @@ def _render_impl(
     # Throughout the component tree, we pass down the info about the components' parents.
     # This is used for correctly resolving slot fills, correct rendering order,
     # or CSS scoping.
-    parent_id, parent_comp_ctx = _get_parent_component_context(context)
     if parent_comp_ctx is not None:
         component_path = [*parent_comp_ctx.component_path, component_name]
         component_tree_context = parent_comp_ctx.tree
@@ -410,17 +416,19 @@ def _render_impl(
         {BLOCK_CONTEXT_KEY: context.render_context.get(BLOCK_CONTEXT_KEY, BlockContext())},  # type: ignore[union-attr]
     )
 
-    trace_component_msg(
-        "COMP_PREP_START",
-        component_name=component_name,
-        component_id=render_id,
-        slot_name=None,
-        component_path=component_path,
-        extra=(
-            f"Received {len(args_list)} args, {len(kwargs_dict)} kwargs, {len(slots_dict)} slots,"
-            f" Available slots: {slots_dict}"
-        ),
-    )
+    # NOTE: Check the log level first, so we don't format the slots dict when tracing is off
+    if is_trace_enabled():
+        trace_component_msg(
+            "COMP_PREP_START",
+            component_name=component_name,
+            component_id=render_id,
+            slot_name=None,
+            component_path=component_path,
+            extra=(
+                f"Received {len(args_list)} args, {len(kwargs_dict)} kwargs, {len(slots_dict)} slots,"
+                f" Available slots: {slots_dict}"
+            ),
+        )
 
     # Register the component to provide
     register_provide_reference(context, component)
@@ -525,39 +533,45 @@ def _render_impl(
         # Capture the template name so we can print better error messages (currently used in slots)
         component_ctx.template_name = template.name if template else None
 
-        with context.update(  # type: ignore[union-attr]
-            {
-                # Make data from context processors available inside templates
-                **context_processors_data,
-                # Private context fields
-                _COMPONENT_CONTEXT_KEY: render_id,
-                COMPONENT_IS_NESTED_KEY: comp_is_nested,
-                # NOTE: Public API for variables accessible from within a component's template
-                # See https://github.com/django-components/django-components/issues/280#issuecomment-2081180940
-                # TODO_V1 - Replace this with Component instance, removing the need for ComponentVars
-                "component_vars": ComponentVars(
-                    args=component.args,
-                    kwargs=component.kwargs,
-                    slots=component.slots,
-                    # TODO_v1 - Remove this, superseded by `component_vars.slots`
-                    #
-                    # For users, we expose boolean variables that they may check
-                    # to see if given slot was filled, e.g.:
-                    # `{% if variable > 8 and component_vars.is_filled.header %}`
-                    is_filled=component.is_filled,
-                ),
-            },
-        ):
-            # Make a "snapshot" of the context as it was at the time of the render call.
-            #
-            # Previously, we recursively called `Template.render()` as this point, but due to recursion
-            # this was limiting the number of nested components to only about 60 levels deep.
-            #
-            # Now, we make a flat copy, so that the context copy is static and doesn't change even if
-            # we leave the `with context.update` blocks.
-            #
-            # This makes it possible to render nested components with a queue, avoiding recursion limits.
-            context_snapshot = snapshot_context(context)
+        # Make a "snapshot" of the context as it was at the time of the render call.
+        #
+        # Previously, we recursively called `Template.render()` as this point, but due to recursion
+        # this was limiting the number of nested components to only about 60 levels deep.
+        #
+        # Now, we make a flat copy, so that the context copy is static and doesn't change even if
+        # we leave the `with context.update` blocks.
+        #
+        # This makes it possible to render nested components with a queue, avoiding recursion limits.
+        context_snapshot = snapshot_context(context)
+
+        # NOTE: Instead of pushing this layer onto the original context only to copy it into
+        #       the snapshot and pop it again, we add it to the snapshot directly.
+        #       The layer is marked as `CopiedDict` so that nested snapshots reuse it.
+        context_snapshot.dicts.append(
+            CopiedDict(
+                {
+                    # Make data from context processors available inside templates
+                    **context_processors_data,
+                    # Private context fields
+                    _COMPONENT_CONTEXT_KEY: render_id,
+                    COMPONENT_IS_NESTED_KEY: comp_is_nested,
+                    # NOTE: Public API for variables accessible from within a component's template
+                    # See https://github.com/django-components/django-components/issues/280#issuecomment-2081180940
+                    # TODO_V1 - Replace this with Component instance, removing the need for ComponentVars
+                    "component_vars": ComponentVars(
+                        args=component.args,
+                        kwargs=component.kwargs,
+                        slots=component.slots,
+                        # TODO_v1 - Remove this, superseded by `component_vars.slots`
+                        #
+                        # For users, we expose boolean variables that they may check
+                        # to see if given slot was filled, e.g.:
+                        # `{% if variable > 8 and component_vars.is_filled.header %}`
+                        is_filled=component.is_filled,
+                    ),
+                },
+            ),
+        )
 
     # Cleanup
     context.render_context.pop()  # type: ignore[union-attr]
@@ -586,7 +600,10 @@ def _render_impl(
         component_path=component_path,
     )
 
-    component.on_render_before(context_snapshot, template)
+    # The default hooks do nothing, so we skip them if the class doesn't override them.
+    # NOTE: Checked on each render, so hooks assigned or patched onto the class later are still called.
+    if comp_cls.on_render_before is not Component.on_render_before:
+        component.on_render_before(context_snapshot, template)
 
     # Emit signal that the template is about to be rendered
     if template is not None:
@@ -650,14 +667,15 @@ def _render_impl(
         # - Override/modify the rendered HTML by returning new value
         # - Raise an exception to discard the HTML and bubble up error
         # - Or don't return anything (or return `None`) to use the original HTML / error
-        try:
-            maybe_output = component.on_render_after(context_snapshot, template, html, error)
-            if maybe_output is not None:
-                html = maybe_output
-                error = None
-        except Exception as new_error:  # noqa: BLE001
-            error = new_error
-            html = None
+        if comp_cls.on_render_after is not Component.on_render_after:
+            try:
+                maybe_output = component.on_render_after(context_snapshot, template, html, error)
+                if maybe_output is not None:
+                    html = maybe_output
+                    error = None
+            except Exception as new_error:  # noqa: BLE001
+                error = new_error
+                html = None
 
         # Prepend an HTML comment to instruct how and what JS and CSS scripts are associated with it.
         # E.g. `<!-- _RENDERED table,123,a92ef298,bd002c3 -->`
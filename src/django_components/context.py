@@ -6,6 +6,8 @@ Compared to `django_components/util/context.py`, this file contains the "busines
 and the list of all internal keys that we define on the `Context` object.
 """
 
+from typing import Any
+
 from django.template import Context
 
 from django_components.util.misc import get_last_index
@@ -29,14 +31,26 @@ def make_isolated_context_copy(context: Context) -> Context:
         context_copy[_COMPONENT_CONTEXT_KEY] = context[_COMPONENT_CONTEXT_KEY]
 
     # Make inject/provide to work in isolated mode
-    context_keys = context.flatten().keys()
-    for key in context_keys:
-        if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-            context_copy[key] = context[key]
+    for key, value in get_inject_context_data(context).items():
+        context_copy[key] = value
 
     return context_copy
 
 
+def get_inject_context_data(context: Context) -> dict[str, Any]:
+    """
+    Get the keys used by inject/provide feature (and their values) from all layers of the Context.
+
+    Same as filtering the output of `context.flatten()`, but without copying the whole Context.
+    """
+    inject_data: dict[str, Any] = {}
+    for layer in context.dicts:
+        for key, value in layer.items():
+            if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
+                inject_data[key] = value  # noqa: PERF403
+    return inject_data
+
+
 def _copy_forloop_context(from_context: Context, to_context: Context) -> None:
     """Forward the info about the current loop"""
     # Note that the ForNode (which implements `{% for %}`) does not
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, NamedTuple, cast
 
 from django.template import Context
 
-from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
+from django_components.context import _INJECT_CONTEXT_KEY_PREFIX, get_inject_context_data
 
 if TYPE_CHECKING:
     from django_components.component import Component
@@ -154,13 +154,11 @@ def register_provide_reference(context: Context, component: "Component") -> None
 
     # For all instances of `{% provide %}` that the current component is within,
     # make note that this component has access to them.
-    for key, value in context.flatten().items():
-        # NOTE: Provided data is stored on the Context object as e.g.
-        # `{"_DJC_INJECT__my_provide": "a1b3c3"}`
-        # Where "a1b3c3" is the ID of the provided data.
-        if not key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-            continue
-
+    #
+    # NOTE: Provided data is stored on the Context object as e.g.
+    # `{"_DJC_INJECT__my_provide": "a1b3c3"}`
+    # Where "a1b3c3" is the ID of the provided data.
+    for key, value in get_inject_context_data(context).items():
         provide_id = cast("str", value)
         provide_key = key.split(_INJECT_CONTEXT_KEY_PREFIX, 1)[1]
 
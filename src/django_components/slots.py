@@ -25,11 +25,11 @@ from django.utils.safestring import SafeString, mark_safe
 
 from django_components.app_settings import ContextBehavior
 from django_components.component_render import component_context_cache
-from django_components.context import _COMPONENT_CONTEXT_KEY, _INJECT_CONTEXT_KEY_PREFIX, COMPONENT_IS_NESTED_KEY
+from django_components.context import _COMPONENT_CONTEXT_KEY, COMPONENT_IS_NESTED_KEY, get_inject_context_data
 from django_components.extension import OnSlotRenderedContext, extensions
 from django_components.node import BaseNode
 from django_components.util.exception import add_slot_to_error_message
-from django_components.util.logger import trace_component_msg
+from django_components.util.logger import is_trace_enabled, trace_component_msg
 from django_components.util.misc import default, get_index, get_last_index, is_identifier
 
 if TYPE_CHECKING:
@@ -683,15 +683,16 @@ class SlotNode(BaseNode):
         is_default = self.flags[SLOT_DEFAULT_FLAG]
         is_required = self.flags[SLOT_REQUIRED_FLAG]
 
-        trace_component_msg(
-            "RENDER_SLOT_START",
-            component_name=component_name,
-            component_id=component_id,
-            slot_name=slot_name,
-            component_path=component_path,
-            slot_fills=slot_fills,
-            extra=f"Available fills: {slot_fills}",
-        )
+        if is_trace_enabled():
+            trace_component_msg(
+                "RENDER_SLOT_START",
+                component_name=component_name,
+                component_id=component_id,
+                slot_name=slot_name,
+                component_path=component_path,
+                slot_fills=slot_fills,
+                extra=f"Available fills: {slot_fills}",
+            )
 
         # Check for errors
         if is_default and not is_dynamic_component:
@@ -806,17 +807,18 @@ class SlotNode(BaseNode):
                 if parent_index is not None:
                     parent_index = parent_index + curr_index + 1
 
-            trace_component_msg(
-                "SLOT_PARENT_INDEX",
-                component_name=component_name,
-                component_id=component_id,
-                slot_name=name,
-                component_path=component_path,
-                extra=(
-                    f"Parent index: {parent_index}, Current index: {curr_index}, "
-                    f"Context stack: {[d.get(_COMPONENT_CONTEXT_KEY) for d in context.dicts]}"
-                ),
-            )
+            if is_trace_enabled():
+                trace_component_msg(
+                    "SLOT_PARENT_INDEX",
+                    component_name=component_name,
+                    component_id=component_id,
+                    slot_name=name,
+                    component_path=component_path,
+                    extra=(
+                        f"Parent index: {parent_index}, Current index: {curr_index}, "
+                        f"Context stack: {[d.get(_COMPONENT_CONTEXT_KEY) for d in context.dicts]}"
+                    ),
+                )
             if parent_index is not None:
                 ctx_id_with_fills = context.dicts[parent_index][_COMPONENT_CONTEXT_KEY]
                 ctx_with_fills = component_context_cache[ctx_id_with_fills]
@@ -828,14 +830,15 @@ class SlotNode(BaseNode):
                 slot_fills = parent_component.raw_slots
 
                 # Add trace message when slot_fills are overwritten
-                trace_component_msg(
-                    "SLOT_FILLS_OVERWRITTEN",
-                    component_name=component_name,
-                    component_id=component_id,
-                    slot_name=slot_name,
-                    component_path=component_path,
-                    extra=f"Slot fills overwritten in django mode. New fills: {slot_fills}",
-                )
+                if is_trace_enabled():
+                    trace_component_msg(
+                        "SLOT_FILLS_OVERWRITTEN",
+                        component_name=component_name,
+                        component_id=component_id,
+                        slot_name=slot_name,
+                        component_path=component_path,
+                        extra=f"Slot fills overwritten in django mode. New fills: {slot_fills}",
+                    )
 
         if fill_name in slot_fills:
             slot_is_filled = True
@@ -910,9 +913,7 @@ class SlotNode(BaseNode):
         # {% provide "abc" val=123 %}
         #   {% slot "content" %}{% endslot %}
         # {% endprovide %}
-        for key, value in context.flatten().items():
-            if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-                extra_context[key] = value  # noqa: PERF403
+        extra_context.update(get_inject_context_data(context))
 
         fallback = SlotFallback(self, context)
 
@@ -216,6 +216,28 @@ def ensure_unique_template(component_cls: type["Component"], template: Template)
 def _get_component_template(component: "Component") -> Template | None:
     trace_component_msg("COMP_LOAD", component_name=component.name, component_id=component.id, slot_name=None)
 
+    # NOTE: Avoids circular import
+    from django_components.component import Component  # noqa: PLC0415
+    from django_components.component_media import UNSET  # noqa: PLC0415
+
+    # Fast path - Component uses only `Component.template` or `Component.template_file`.
+    # The Template instance is created once per class when the template is first resolved,
+    # and cached in `ComponentMedia._template`. So after the first render, we can return it directly,
+    # skipping the per-render lookups of `template` / `template_file` along the class MRO.
+    # NOTE: The getters are checked on each render, so getters assigned onto the class later are still used.
+    # TODO_V1 - Remove the getters check once we remove `get_template_string()`, `get_template_name()`,
+    #           `get_template()`
+    comp_cls = component.__class__
+    has_template_getters = (
+        comp_cls.get_template_name is not Component.get_template_name
+        or comp_cls.get_template is not Component.get_template
+        or hasattr(component, "get_template_string")
+    )
+    if not has_template_getters:
+        comp_media = comp_cls._component_media  # type: ignore[attr-defined]
+        if comp_media.resolved_template and comp_media._template is not UNSET:
+            return comp_media._template
+
     # TODO_V1 - Remove, not needed once we remove `get_template_string()`, `get_template_name()`, `get_template()`
     template_sources: dict[str, str | Template | None] = {}
 
@@ -273,8 +295,6 @@ def _get_component_template(component: "Component") -> Template | None:
         template = component.__class__._component_media._template  # type: ignore[attr-defined]
         # Race condition: treat UNSET as None
         # See https://github.com/django-components/django-components/pull/1588
-        from django_components.component_media import UNSET  # noqa: PLC0415
-
         if template is UNSET:
             template = None
         template_string = None
@@ -54,11 +54,20 @@ def trace(message: str, *args: Any, **kwargs: Any) -> None:
         }
         ```
 
+    """
+    if is_trace_enabled():
+        logger.log(actual_trace_level_num, message, *args, **kwargs)
+
+
+def is_trace_enabled() -> bool:
+    """
+    Check whether TRACE level logs would be emitted.
+
+    Use this to skip building expensive log messages when tracing is off.
     """
     if actual_trace_level_num == -1:
         setup_logging()
-    if logger.isEnabledFor(actual_trace_level_num):
-        logger.log(actual_trace_level_num, message, *args, **kwargs)
+    return logger.isEnabledFor(actual_trace_level_num)
 
 
 def trace_node_msg(
@@ -73,6 +82,9 @@ def trace_node_msg(
 
     `"PARSE slot ID 0088 ...Done!"`
     """
+    if not is_trace_enabled():
+        return
+
     action_normalized = action.ljust(6, " ")
     full_msg = f"{action_normalized} NODE {node_type} ID {node_id} {msg}"
 
@@ -96,6 +108,9 @@ def trace_component_msg(
 
     `"RENDER_SLOT COMPONENT 'component_name' SLOT: 'slot_name' FILLS: 'fill_name' PATH: Root > Child > Grandchild "`
     """
+    if not is_trace_enabled():
+        return
+
     component_id_str = f"ID {component_id}" if component_id else ""
     slot_name_str = f"SLOT: '{slot_name}'" if slot_name else ""
     component_path_str = "PATH: " + " > ".join(component_path) if component_path else ""
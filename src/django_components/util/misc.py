@@ -16,6 +16,7 @@ from typing import (
     cast,
 )
 from urllib import parse
+from weakref import WeakKeyDictionary
 
 from django_components.constants import COMP_ID_PREFIX, UID_LENGTH
 from django_components.util.nanoid import generate
@@ -150,6 +151,10 @@ def flatten(lst: Iterable[Iterable[T]]) -> list[T]:
     return list(chain.from_iterable(lst))
 
 
+# Field names of dataclasses passed to `to_dict()`, so we call `fields()` only once per class
+dataclass_field_names_cache: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
 def to_dict(data: Any) -> dict:
     """
     Convert object to a dict.
@@ -162,7 +167,12 @@ def to_dict(data: Any) -> dict:
         return data._asdict()
     if is_dataclass(data):  # Case: dataclass
         # NOTE: This is same as `asdict`, but without recursing into nested dataclasses
-        return {f.name: getattr(data, f.name) for f in fields(data)}
+        data_cls = type(data)
+        field_names = dataclass_field_names_cache.get(data_cls)
+        if field_names is None:
+            field_names = tuple(f.name for f in fields(data))
+            dataclass_field_names_cache[data_cls] = field_names
+        return {name: getattr(data, name) for name in field_names}
 
     return dict(data)
 
@@ -5,6 +5,7 @@ This file is for logic that focuses on transforming the AST of template tags
 
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
 from typing import (
     Any,
     NamedTuple,
@@ -189,7 +190,14 @@ def resolve_filter(
         return filter_func(value, arg)
 
 
-# TODO - Cache?
+# Parse each unique variable (e.g. `my_user.username`) only once per process, and share
+# the `Variable` instance across all tags and renders. `Variable` is not modified on resolve,
+# and translations are looked up only at resolve time, so the instances are safe to reuse.
+@lru_cache(maxsize=2048)
+def compile_variable(var: str) -> Variable:
+    return Variable(var)
+
+
 def resolve_variable(
     context: Mapping[str, Any],
     _source: str,
@@ -199,12 +207,11 @@ def resolve_variable(
     var: str,
 ) -> Any:
     try:
-        return Variable(var).resolve(context)
+        return compile_variable(var).resolve(context)
     except VariableDoesNotExist:
         return ""
 
 
-# TODO - Cache?
 def resolve_translation(
     context: Mapping[str, Any],
     _source: str,
@@ -216,10 +223,14 @@ def resolve_translation(
     # The compiler gives us the variable stripped of `_(")` and `"),
     # so we put it back for Django's Variable class to interpret it as a translation.
     translation_var = "_('" + text + "')"
-    return Variable(translation_var).resolve(context)
+    return compile_variable(translation_var).resolve(context)
 
 
-python_expression_cache: dict[str, Callable[[Mapping[str, Any]], Any]] = {}
+# Compile each unique Python expression only once per process, keyed on the expression source.
+# The cache is bounded so that templates generated at runtime can't grow it indefinitely.
+@lru_cache(maxsize=2048)
+def compile_python_expression(code: str) -> Callable[[Mapping[str, Any]], Any]:
+    return safe_eval(code)
 
 
 def resolve_python_expression(
@@ -230,10 +241,9 @@ def resolve_python_expression(
     _tags: Mapping[str, Callable],
     code: str,
 ) -> Any:
-    if code not in python_expression_cache:
-        python_expression_cache[code] = safe_eval(code)
-
-    expr_resolver = python_expression_cache[code]
+    # NOTE: The context is passed to the compiled expression as is (no `context.flatten()`),
+    # variables are looked up lazily only when the expression accesses them.
+    expr_resolver = compile_python_expression(code)
     return expr_resolver(context)
 
 
@@ -3,9 +3,11 @@ Tests focusing on the Component class.
 For tests focusing on the `component` tag, see `test_templatetags_component.py`
 """
 
+import gc
 import os
 import re
 from typing import Any, Literal, NamedTuple
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings
@@ -27,6 +29,8 @@ from django_components import (
     registry,
     types,
 )
+from django_components import component as component_module
+from django_components.component import ALL_COMPONENTS
 from django_components.template import _get_component_template
 from django_components.testing import djc_test
 from django_components.urls import urlpatterns as dc_urlpatterns
@@ -2003,6 +2007,38 @@ class TestComponentRender:
         ):
             Root.render()
 
+    def test_data_methods_called_only_when_overridden(self):
+        class Plain(Component):
+            template = "Hello"
+
+        class WithData(Plain):
+            def get_template_data(self, args, kwargs, slots, context):
+                return {"name": "John"}
+
+        class WithDataChild(WithData):
+            template = "Hello {{ name }}"
+
+        # The base implementations are not called when not overridden
+        with patch.object(Component, "get_js_data", side_effect=AssertionError("Should not be called")):
+            assert Plain.render() == "Hello"
+            # Overrides are detected also when inherited from a parent component
+            assert WithDataChild.render() == "Hello John"
+
+    def test_data_methods_assigned_after_class_creation(self):
+        class Greeting(Component):
+            template = "Hi {{ name }}"
+
+        assert Greeting.render() == "Hi "
+
+        with patch.object(Greeting, "get_template_data", lambda *_: {"name": "Bob"}):
+            assert Greeting.render() == "Hi Bob"
+
+        class GreetingChild(Greeting):
+            pass
+
+        Greeting.get_template_data = lambda *_: {"name": "Alice"}  # type: ignore[method-assign]
+        assert GreetingChild.render() == "Hi Alice"
+
 
 @djc_test
 class TestComponentHook:
@@ -2137,6 +2173,43 @@ class TestComponentHook:
 
         return BrokenComponent
 
+    def test_hooks_called_only_when_overridden(self):
+        calls: list[str] = []
+
+        class Plain(Component):
+            template = "Hello"
+
+        class WithHooks(Plain):
+            def on_render_before(self, context: Context, template: Template | None) -> None:
+                calls.append("on_render_before")
+
+            def on_render_after(self, context, template, result, error):
+                calls.append("on_render_after")
+
+        # The base implementations are not called when not overridden
+        with (
+            patch.object(Component, "on_render_before", side_effect=AssertionError("Should not be called")),
+            patch.object(Component, "on_render_after", side_effect=AssertionError("Should not be called")),
+        ):
+            assert Plain.render() == "Hello"
+        assert calls == []
+
+        assert WithHooks.render() == "Hello"
+        assert calls == ["on_render_before", "on_render_after"]
+
+    def test_hooks_assigned_after_class_creation(self):
+        calls: list[str] = []
+
+        class Greeting(Component):
+            template = "Hello"
+
+        Greeting.on_render_before = lambda *_: calls.append("on_render_before")  # type: ignore[method-assign]
+
+        with patch.object(Greeting, "on_render_after", lambda *_: calls.append("on_render_after")):
+            assert Greeting.render() == "Hello"
+
+        assert calls == ["on_render_before", "on_render_after"]
+
     def test_order(self):
         calls: list[str] = []
 
@@ -2725,3 +2798,28 @@ class TestComponentHelpers:
             """
 
         assert len(all_components()) == all_comps_before + 2
+
+    def test_all_components_drops_collected_classes(self):
+        class TestComponent(Component):
+            template: types.django_html = """
+                Hello from test
+            """
+
+        comp_ref = ALL_COMPONENTS[-1]
+        assert comp_ref() is TestComponent
+
+        del TestComponent
+        gc.collect()
+        assert comp_ref() is None
+
+        # Dead references are dropped when the next component class is created,
+        # once they make up over half of `ALL_COMPONENTS`
+        with patch.object(component_module, "_dead_component_refs_count", len(ALL_COMPONENTS)):
+
+            class OtherComponent(Component):
+                template: types.django_html = """
+                    Hello from other
+                """
+
+        assert comp_ref not in ALL_COMPONENTS
+        assert ALL_COMPONENTS[-1]() is OtherComponent
@@ -11,6 +11,7 @@ from django.template import Context, RequestContext, Template
 from pytest_django.asserts import assertHTMLEqual, assertInHTML
 
 from django_components import Component, register, registry, types
+from django_components.context import get_inject_context_data, make_isolated_context_copy
 from django_components.testing import djc_test
 from django_components.util.misc import gen_id
 
@@ -534,6 +535,20 @@ class TestIsolatedContext:
         rendered = template.render(Context({"variable": "outer_value"})).strip()
         assert "outer_value" not in rendered
 
+    def test_isolated_context_copy_keeps_inject_keys(self):
+        context = Context({"variable": "outer_value", "_DJC_INJECT__abc": "id_1"})
+        context.update({"_DJC_INJECT__abc": "id_2", "_DJC_INJECT__xyz": "id_3"})
+
+        assert get_inject_context_data(context) == {
+            "_DJC_INJECT__abc": "id_2",
+            "_DJC_INJECT__xyz": "id_3",
+        }
+
+        context_copy = make_isolated_context_copy(context)
+        assert "variable" not in context_copy
+        assert context_copy["_DJC_INJECT__abc"] == "id_2"
+        assert context_copy["_DJC_INJECT__xyz"] == "id_3"
+
 
 @djc_test
 class TestIsolatedContextSetting:
@@ -10,7 +10,11 @@ from pytest_django.asserts import assertHTMLEqual
 from django_components import Component, register, registry, types
 from django_components.expression import TemplateExpression
 from django_components.testing import djc_test
-from django_components.util.template_tag import is_aggregate_key
+from django_components.util.template_tag import (
+    compile_python_expression,
+    compile_variable,
+    is_aggregate_key,
+)
 
 from .testutils import PARAMETRIZE_CONTEXT_BEHAVIOR, setup_test_config
 
@@ -540,6 +544,30 @@ class TestTemplateExpression:
             """,
         )
 
+    def test_variable_parsed_once(self):
+        @register("test")
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                <div>{{ text }}</div>
+            """
+
+            def get_template_data(self, args, kwargs, slots, context):
+                return {"text": kwargs["text"]}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component 'test' text=parsed_once_var.name / %}
+            {% component 'test' text=parsed_once_var.name / %}
+        """
+
+        misses_before = compile_variable.cache_info().misses
+        template = Template(template_str)
+        rendered = template.render(Context({"parsed_once_var": {"name": "John"}}))
+        template.render(Context({"parsed_once_var": {"name": "Mary"}}))
+
+        assert rendered.count("John") == 2
+        assert compile_variable.cache_info().misses == misses_before + 1
+
 
 class TestSpreadOperator:
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
@@ -938,6 +966,30 @@ class TestPythonExpressions:
             """,
         )
 
+    def test_python_expression_compiled_once(self):
+        @register("test")
+        class SimpleComponent(Component):
+            def get_template_data(self, args, kwargs, slots, context):
+                return {"text": kwargs["text"]}
+
+            template: types.django_html = """
+                <div>{{ text }}</div>
+            """
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component 'test' text=(name + '_compiled_once') / %}
+            {% component 'test' text=(name + '_compiled_once') / %}
+        """
+
+        misses_before = compile_python_expression.cache_info().misses
+        template = Template(template_str)
+        template.render(Context({"name": "a"}))
+        template.render(Context({"name": "b"}))
+
+        # Same expression source, rendered 4 times, is compiled only once
+        assert compile_python_expression.cache_info().misses == misses_before + 1
+
 
 @djc_test
 class TestLiteralListsAndDicts:
@@ -52,6 +52,41 @@ class TestTemplateCache:
         template_2 = _get_component_template(comp)
         assert template_2._test_id == "123"  # type: ignore[union-attr]
 
+    def test_component_template_from_class_attr_is_reused(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+        template_1 = _get_component_template(SimpleComponent())
+        template_2 = _get_component_template(SimpleComponent())
+
+        assert template_1 is not None
+        assert template_1 is template_2
+        assert template_1 is SimpleComponent._template
+
+    # TODO_v1 - Remove
+    def test_component_template_getter_assigned_after_first_render(self):
+        class SimpleComponent(Component):
+            template: types.django_html = "Hello"
+
+        assert SimpleComponent.render() == "Hello"
+
+        SimpleComponent.template = None
+        SimpleComponent.get_template = lambda *_: "Hi from getter"  # type: ignore[method-assign]
+        assert SimpleComponent.render() == "Hi from getter"
+
+    # TODO_v1 - Remove
+    def test_component_template_string_getter_assigned_after_first_render(self):
+        class SimpleComponent(Component):
+            template: types.django_html = "Hello"
+
+        assert SimpleComponent.render() == "Hello"
+
+        SimpleComponent.template = None
+        SimpleComponent.get_template_string = lambda *_: "Hi from string getter"  # type: ignore[attr-defined]
+        assert SimpleComponent.render() == "Hi from string getter"
+
 
 @djc_test
 class TestTemplateMonkeypatch:
@@ -1,4 +1,7 @@
-from django_components.util.misc import is_str_wrapped_in_quotes
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from django_components.util.misc import dataclass_field_names_cache, is_str_wrapped_in_quotes, to_dict
 
 
 class TestUtils:
@@ -13,3 +16,23 @@ class TestUtils:
         assert is_str_wrapped_in_quotes("") is False
         assert is_str_wrapped_in_quotes('""') is True
         assert is_str_wrapped_in_quotes("\"'") is False
+
+    def test_to_dict(self):
+        class MyTuple(NamedTuple):
+            a: int
+            b: str
+
+        @dataclass
+        class MyData:
+            a: int
+            b: str
+
+        assert to_dict({"a": 1}) == {"a": 1}
+        assert to_dict(MyTuple(a=1, b="x")) == {"a": 1, "b": "x"}
+        assert to_dict([("a", 1)]) == {"a": 1}
+
+        assert MyData not in dataclass_field_names_cache
+        assert to_dict(MyData(a=1, b="x")) == {"a": 1, "b": "x"}
+        assert dataclass_field_names_cache[MyData] == ("a", "b")
+        # Cached field names are reused for other instances
+        assert to_dict(MyData(a=2, b="y")) == {"a": 2, "b": "y"}